@@ -1,7 +1,9 @@
+# pip install numpy orjson
 import json
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
-import random
+import numpy as np
+import orjson
 
 
 def generate_availability(
@@ -20,7 +22,10 @@ def generate_availability(
     Returns:
         JSON string of generated availability data
     """
-    availability = {}
+    # JSON object keys are strings; convert before deduplicating so 1 and "1" don't
+    # become duplicate keys
+    restaurant_ids = list(dict.fromkeys(str(restaurant_id) for restaurant_id in restaurant_ids))
+    days_ahead = max(days_ahead, 0)
     
     # Time slots for restaurant availability
     time_slots = [
@@ -29,76 +34,82 @@ def generate_availability(
         "20:00", "20:30", "21:00", "21:30", "22:00"            # Late dinner
     ]
     
-    # Get today's date
-    today = datetime.now().date()
+    # Draw every random number for all (restaurant, day, slot) cells at once
+    rng = np.random.default_rng()
+    shape = (len(restaurant_ids), days_ahead, len(time_slots))
     
-    # Generate availability for each restaurant
-    for restaurant_id in restaurant_ids:
-        availability[restaurant_id] = {}
-        
-        # Generate availability for each day
-        for day_offset in range(days_ahead):
-            date = today + timedelta(days=day_offset)
-            date_string = date.strftime('%Y-%m-%d')
-            
-            # Day of week (0 = Monday, 6 = Sunday)
-            day_of_week = date.weekday()
-            
-            availability[restaurant_id][date_string] = {}
-            
-            # Generate availability for each time slot
-            for time_slot in time_slots:
-                # Determine if this is lunch or dinner
-                hour = int(time_slot.split(':')[0])
-                is_lunch = hour < 15
-                is_dinner = hour >= 17
-                
-                # Skip lunch slots on weekends for some restaurants (30% chance)
-                if is_lunch and day_of_week >= 5 and random.random() < 0.3:
-                    continue  # Skip this slot
-                
-                # Generate available tables based on various factors
-                available_tables = 0
-                
-                # Base availability depends on time slot popularity
-                if hour in [19, 20]:
-                    # Peak dinner time (7-8pm) - lower availability
-                    available_tables = random.randint(0, 2)  # 0-2 tables
-                elif hour in [18, 21]:
-                    # Popular times - moderate availability
-                    available_tables = random.randint(0, 4)  # 0-4 tables
-                elif is_lunch:
-                    # Lunch - higher availability
-                    available_tables = random.randint(2, 7)  # 2-7 tables
-                else:
-                    # Off-peak dinner - good availability
-                    available_tables = random.randint(1, 8)  # 1-8 tables
-                
-                # Weekend dinner adjustment - busier
-                if day_of_week >= 4 and is_dinner:  # Friday, Saturday, Sunday
-                    available_tables = max(0, available_tables - 2)
-                
-                # Weekday lunch adjustment - busier
-                if 0 <= day_of_week <= 4 and is_lunch:  # Monday to Friday
-                    available_tables = max(0, available_tables - 1)
-                
-                # Random fully booked slots (20% chance for peak times)
-                if hour in [19, 20] and random.random() < 0.2:
-                    available_tables = 0
-                
-                availability[restaurant_id][date_string][time_slot] = available_tables
-    
-    json_string = json.dumps(availability, indent=2)
+    # Determine if each slot is lunch or dinner
+    hours = np.array([int(time_slot.split(':')[0]) for time_slot in time_slots])
+    is_lunch = hours < 15
+    is_dinner = hours >= 17
+    is_peak = np.isin(hours, [19, 20])
+    is_popular = np.isin(hours, [18, 21])
+    
+    # Get today's date and the day of week of each generated date (0 = Monday, 6 = Sunday)
+    today = datetime.now().date()
+    date_strings = [
+        (today + timedelta(days=day_offset)).strftime('%Y-%m-%d')
+        for day_offset in range(days_ahead)
+    ]
+    day_of_week = ((np.arange(days_ahead) + today.weekday()) % 7)[:, None]
+    
+    # Base availability depends on time slot popularity:
+    # peak dinner time (7-8pm) 0-2 tables, popular times 0-4 tables,
+    # lunch 2-7 tables, off-peak dinner 1-8 tables
+    slot_kinds = [is_peak, is_popular, is_lunch]
+    low = np.select(slot_kinds, [0, 0, 2], default=1)
+    high = np.select(slot_kinds, [2, 4, 7], default=8)
+    tables = rng.integers(low, high, size=shape, endpoint=True)
+    
+    # Weekend dinner adjustment - busier (Friday, Saturday, Sunday)
+    tables -= 2 * ((day_of_week >= 4) & is_dinner)
+    
+    # Weekday lunch adjustment - busier (Monday to Friday)
+    tables -= (day_of_week <= 4) & is_lunch
+    
+    tables = np.maximum(tables, 0)
+    
+    # Random fully booked slots (20% chance for peak times)
+    tables[is_peak & (rng.random(shape) < 0.2)] = 0
+    
+    # Skip lunch slots on weekends for some restaurants (30% chance)
+    skipped = (day_of_week >= 5) & is_lunch & (rng.random(shape) < 0.3)
+    
+    # Write the nested restaurant -> date -> time JSON straight into a buffer,
+    # reusing pre-encoded key fragments instead of building an intermediate dict
+    date_keys = [f'\n    "{date_string}": {{'.encode() for date_string in date_strings]
+    slot_keys = [f'\n      "{time_slot}": '.encode() for time_slot in time_slots]
+    table_counts = [str(count).encode() for count in range(int(high.max()) + 1)]
+    
+    json_bytes = bytearray(b'{')
+    for restaurant_index, (restaurant_id, restaurant_tables, restaurant_skipped) in enumerate(
+        zip(restaurant_ids, tables.tolist(), skipped.tolist())
+    ):
+        if restaurant_index:
+            json_bytes += b','
+        json_bytes += b'\n  ' + orjson.dumps(restaurant_id) + b': {'
+        for day_index, (day_tables, day_skipped) in enumerate(zip(restaurant_tables, restaurant_skipped)):
+            if day_index:
+                json_bytes += b','
+            json_bytes += date_keys[day_index]
+            json_bytes += b','.join(
+                slot_keys[slot_index] + table_counts[available_tables]
+                for slot_index, (available_tables, skip) in enumerate(zip(day_tables, day_skipped))
+                if not skip
+            )
+            json_bytes += b'\n    }'
+        json_bytes += b'\n  }' if days_ahead else b'}'
+    json_bytes += b'\n}' if restaurant_ids else b'}'
     
     if save_to_file:
         try:
-            with open('availability.json', 'w', encoding='utf-8') as f:
-                f.write(json_string)
+            with open('availability.json', 'wb') as f:
+                f.write(json_bytes)
             print(f"Successfully saved availability for {len(restaurant_ids)} restaurants to availability.json")
         except Exception as e:
             print(f"Error saving to file: {e}")
     
-    return json_string
+    return json_bytes.decode()
 
 
 def generate_availability_from_file(
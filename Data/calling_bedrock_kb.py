@@ -1,8 +1,24 @@
 # pip install boto3
 import boto3
+from functools import lru_cache
 from typing import Dict, List, Optional
 import json
 
+
+@lru_cache(maxsize=8)
+def get_bedrock_agent_client(region: str):
+    """Create the Bedrock Agent Runtime client once per region and reuse it"""
+    return boto3.client(
+        service_name='bedrock-agent-runtime',
+        region_name=region
+    )
+
+
+@lru_cache(maxsize=8)
+def get_default_model_arn(region: str) -> str:
+    """Default model ARN (Claude 3 Sonnet) for a region"""
+    return f"arn:aws:bedrock:{region}::foundation-model/anthropic.claude-3-sonnet-20240229-v1:0"
+
 def query_bedrock_knowledge_base(
     knowledge_base_id: str,
     prompt: str,
@@ -21,15 +37,12 @@ def query_bedrock_knowledge_base(
     Returns:
         dict: Response containing the generated text and citations
     """
-    # Initialize the Bedrock Agent Runtime client
-    client = boto3.client(
-        service_name='bedrock-agent-runtime',
-        region_name=region
-    )
+    # Reuse the cached Bedrock Agent Runtime client for this region
+    client = get_bedrock_agent_client(region)
     
     # Set default model if not provided
     if model_arn is None:
-        model_arn = f"arn:aws:bedrock:{region}::foundation-model/anthropic.claude-3-sonnet-20240229-v1:0"
+        model_arn = get_default_model_arn(region)
     
     try:
         # Call the retrieve_and_generate API
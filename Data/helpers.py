@@ -1,9 +1,15 @@
+# pip install numpy orjson
 import json
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
-from dataclasses import dataclass
+from typing import List, Dict, Any, FrozenSet, Iterator, Optional, Set, Tuple
+from datetime import date as calendar_date, datetime, timedelta
+from dataclasses import dataclass, field
+from functools import lru_cache
+from bisect import bisect_left
+from time import monotonic, time as epoch_time
 import random
 import string
+import numpy as np
+import orjson
 
 
 # ============================================================================
@@ -53,6 +59,41 @@ class Booking:
     created_at: str
 
 
+@dataclass
+class RestaurantIndex:
+    """Lookup tables over a restaurant list; index sets hold positions into `restaurants`"""
+    restaurants: List[Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    by_cuisine: Dict[str, Set[int]] = field(default_factory=dict)
+    by_location: Dict[str, Set[int]] = field(default_factory=dict)
+    by_price: Dict[str, Set[int]] = field(default_factory=dict)
+    rating_sorted: List[Tuple[float, int]] = field(default_factory=list)
+    dietary_sets: List[FrozenSet[str]] = field(default_factory=list)
+    ratings: np.ndarray = field(default_factory=lambda: np.empty(0))
+    dietary_tags: Dict[str, int] = field(default_factory=dict)
+    dietary_matrix: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=bool))
+    dietary_masks: List[int] = field(default_factory=list)
+    cuisine_codes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    cuisine_names: List[str] = field(default_factory=list)
+    location_codes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    location_names: List[str] = field(default_factory=list)
+    price_codes: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
+    price_names: List[str] = field(default_factory=list)
+
+
+@dataclass
+class AvailabilityStore:
+    """Dense restaurant x date x time table counts; -1 marks slots a restaurant does not offer"""
+    tables: np.ndarray
+    restaurant_ids: List[str]
+    dates: List[str]
+    times: List[str]
+    rid_to_idx: Dict[str, int]
+    date_to_idx: Dict[str, int]
+    time_to_idx: Dict[str, int]
+    time_minutes: List[int]
+
+
 # ============================================================================
 # FILE I/O HELPERS
 # ============================================================================
@@ -67,9 +108,37 @@ def load_restaurants(file_path: str = 'restaurants.json') -> List[Dict[str, Any]
         return []
 
 
-def load_availability(file_path: str = 'availability.json') -> Dict[str, Any]:
-    """Load availability from JSON file"""
+def iter_availability(
+    file_path: str = 'availability.json',
+    restaurant_ids: Optional[List[str]] = None
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Stream (restaurant_id, availability) pairs from JSON file, optionally only for some restaurants"""
+    import ijson  # pip install ijson
+    
+    wanted = set(restaurant_ids) if restaurant_ids is not None else None
+    if wanted is not None and not wanted:
+        return
+    
+    with open(file_path, 'rb') as f:
+        for restaurant_id, restaurant_availability in ijson.kvitems(f, ''):
+            if wanted is None:
+                yield restaurant_id, restaurant_availability
+            elif restaurant_id in wanted:
+                yield restaurant_id, restaurant_availability
+                wanted.discard(restaurant_id)
+                # Stop reading once every requested restaurant has been found
+                if not wanted:
+                    return
+
+
+def load_availability(
+    file_path: str = 'availability.json',
+    restaurant_ids: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Load availability from JSON file, streaming only the given restaurants if restaurant_ids is set"""
     try:
+        if restaurant_ids is not None:
+            return dict(iter_availability(file_path, restaurant_ids))
         with open(file_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
@@ -77,11 +146,27 @@ def load_availability(file_path: str = 'availability.json') -> Dict[str, Any]:
         return {}
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson has no native support for"""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    # orjson only handles C-contiguous arrays of some dtypes natively (not views like
+    # tables[:, 0, :] or tables.T, nor float16 scalars)
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def save_to_file(data: Any, file_path: str) -> bool:
-    """Save data to JSON file"""
+    """Save data to JSON file; dataclasses (Booking, Restaurant, ...) and NumPy values are supported"""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        json_bytes = orjson.dumps(
+            data,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+        with open(file_path, 'wb') as f:
+            f.write(json_bytes)
         return True
     except Exception as e:
         print(f"Error saving to {file_path}: {e}")
@@ -92,8 +177,57 @@ def save_to_file(data: Any, file_path: str) -> bool:
 # RESTAURANT SEARCH & FILTER HELPERS
 # ============================================================================
 
+def _categorical_codes(values: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """Encode values as int32 codes numbered in order of first appearance"""
+    codes: Dict[str, int] = {}
+    return np.array([codes.setdefault(value, len(codes)) for value in values], dtype=np.int32), list(codes)
+
+
+def dietary_mask(index: RestaurantIndex, dietary_options: FrozenSet[str]) -> int:
+    """Pack lowercase dietary options into an int with one bit per known dietary tag"""
+    mask = 0
+    for option in dietary_options:
+        if option in index.dietary_tags:
+            mask |= 1 << index.dietary_tags[option]
+    return mask
+
+
+def build_restaurant_index(restaurants: List[Dict[str, Any]]) -> RestaurantIndex:
+    """Build cuisine/location/price/rating indexes once for repeated searches"""
+    index = RestaurantIndex(restaurants)
+    
+    for position, restaurant in enumerate(restaurants):
+        index.by_id.setdefault(restaurant['id'], restaurant)
+        index.by_cuisine.setdefault(restaurant['cuisine'].lower(), set()).add(position)
+        index.by_location.setdefault(restaurant['location'].lower(), set()).add(position)
+        index.by_price.setdefault(restaurant['price_range'], set()).add(position)
+    
+    index.rating_sorted = sorted((restaurant['rating'], position) for position, restaurant in enumerate(restaurants))
+    index.dietary_sets = [
+        frozenset(option.lower() for option in restaurant['dietary_options'])
+        for restaurant in restaurants
+    ]
+    
+    # Column arrays for vectorized scoring: ratings plus one boolean column per dietary tag
+    index.ratings = np.array([restaurant['rating'] for restaurant in restaurants], dtype=np.float64)
+    for dietary in index.dietary_sets:
+        for option in dietary:
+            index.dietary_tags.setdefault(option, len(index.dietary_tags))
+    index.dietary_matrix = np.zeros((len(restaurants), len(index.dietary_tags)), dtype=bool)
+    for position, dietary in enumerate(index.dietary_sets):
+        index.dietary_matrix[position, [index.dietary_tags[option] for option in dietary]] = True
+    index.dietary_masks = [dietary_mask(index, dietary) for dietary in index.dietary_sets]
+    
+    # Categorical codes for bincount-based statistics
+    index.cuisine_codes, index.cuisine_names = _categorical_codes([r['cuisine'] for r in restaurants])
+    index.location_codes, index.location_names = _categorical_codes([r['location'] for r in restaurants])
+    index.price_codes, index.price_names = _categorical_codes([r['price_range'] for r in restaurants])
+    
+    return index
+
+
 def search_restaurants(
-    restaurants: List[Dict[str, Any]],
+    index: RestaurantIndex,
     cuisine: Optional[str] = None,
     location: Optional[str] = None,
     price_range: Optional[str] = None,
@@ -103,51 +237,54 @@ def search_restaurants(
     private_dining: Optional[bool] = None
 ) -> List[Dict[str, Any]]:
     """Search restaurants by filters"""
-    results = restaurants.copy()
+    candidates = []
     
     # Filter by cuisine
     if cuisine:
-        results = [r for r in results if r['cuisine'].lower() == cuisine.lower()]
+        candidates.append(index.by_cuisine.get(cuisine.lower(), set()))
     
     # Filter by location
     if location:
-        results = [r for r in results if r['location'].lower() == location.lower()]
+        candidates.append(index.by_location.get(location.lower(), set()))
     
     # Filter by price range
     if price_range:
-        results = [r for r in results if r['price_range'] == price_range]
-    
-    # Filter by dietary options
-    if dietary_options:
-        results = [
-            r for r in results
-            if all(
-                any(opt.lower() == ro.lower() for ro in r['dietary_options'])
-                for opt in dietary_options
-            )
-        ]
+        candidates.append(index.by_price.get(price_range, set()))
     
     # Filter by minimum rating
     if min_rating is not None:
-        results = [r for r in results if r['rating'] >= min_rating]
+        start = bisect_left(index.rating_sorted, (min_rating, -1))
+        candidates.append({position for _, position in index.rating_sorted[start:]})
+    
+    # Intersect indexed filters smallest-first, keeping the original restaurant order
+    if candidates:
+        positions = sorted(set.intersection(*sorted(candidates, key=len)))
+    else:
+        positions = range(len(index.restaurants))
+    
+    # Apply the remaining non-indexed filters in a single pass over the candidates
+    predicates = []
+    restaurants = index.restaurants
+    
+    # Filter by dietary options
+    if dietary_options:
+        dietary_query = frozenset(option.lower() for option in dietary_options)
+        predicates.append(lambda p: dietary_query <= index.dietary_sets[p])
     
     # Filter by outdoor seating
     if outdoor_seating is not None:
-        results = [r for r in results if r['outdoor_seating'] == outdoor_seating]
+        predicates.append(lambda p: restaurants[p]['outdoor_seating'] == outdoor_seating)
     
     # Filter by private dining
     if private_dining is not None:
-        results = [r for r in results if r['private_dining'] == private_dining]
+        predicates.append(lambda p: restaurants[p]['private_dining'] == private_dining)
     
-    return results
+    return [restaurants[p] for p in positions if all(predicate(p) for predicate in predicates)]
 
 
-def get_restaurant_by_id(restaurants: List[Dict[str, Any]], restaurant_id: str) -> Optional[Dict[str, Any]]:
+def get_restaurant_by_id(index: RestaurantIndex, restaurant_id: str) -> Optional[Dict[str, Any]]:
     """Get restaurant by ID"""
-    for restaurant in restaurants:
-        if restaurant['id'] == restaurant_id:
-            return restaurant
-    return None
+    return index.by_id.get(restaurant_id)
 
 
 def get_restaurants_by_cuisine(restaurants: List[Dict[str, Any]], cuisine: str) -> List[Dict[str, Any]]:
@@ -175,57 +312,98 @@ def sort_by_price(restaurants: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 # AVAILABILITY HELPERS
 # ============================================================================
 
+def build_availability_store(availability: Dict[str, Any]) -> AvailabilityStore:
+    """Pack nested availability into a (restaurants, dates, times) array of the smallest int type that fits"""
+    restaurant_ids = list(availability)
+    dates = sorted({date for restaurant_availability in availability.values() for date in restaurant_availability})
+    times = sorted({
+        time
+        for restaurant_availability in availability.values()
+        for date_slots in restaurant_availability.values()
+        for time in date_slots
+    }, key=time_to_minutes)
+    rid_to_idx = {restaurant_id: i for i, restaurant_id in enumerate(restaurant_ids)}
+    date_to_idx = {date: i for i, date in enumerate(dates)}
+    time_to_idx = {time: i for i, time in enumerate(times)}
+    
+    # int8 covers realistic table counts; widen rather than overflow (negatives mean "not offered")
+    max_count = max(
+        (count for restaurant_availability in availability.values()
+         for date_slots in restaurant_availability.values()
+         for count in date_slots.values()),
+        default=0
+    )
+    dtype = next(
+        (dtype for dtype in (np.int8, np.int16, np.int32, np.int64) if max_count <= np.iinfo(dtype).max),
+        None
+    )
+    if dtype is None:
+        raise ValueError(f"Table count {max_count} is too large to store")
+    
+    tables = np.full((len(restaurant_ids), len(dates), len(times)), -1, dtype=dtype)
+    for restaurant_id, restaurant_availability in availability.items():
+        restaurant_tables = tables[rid_to_idx[restaurant_id]]
+        for date, date_slots in restaurant_availability.items():
+            date_tables = restaurant_tables[date_to_idx[date]]
+            for time, count in date_slots.items():
+                date_tables[time_to_idx[time]] = count
+    
+    return AvailabilityStore(
+        tables, restaurant_ids, dates, times, rid_to_idx, date_to_idx, time_to_idx,
+        [time_to_minutes(time) for time in times]
+    )
+
+
 def check_availability(
-    availability: Dict[str, Any],
+    store: AvailabilityStore,
     restaurant_id: str,
     date: str,
     time: str
 ) -> Optional[int]:
     """Check if a restaurant has availability at a specific date and time"""
     try:
-        return availability[restaurant_id][date][time]
+        tables = int(store.tables[store.rid_to_idx[restaurant_id], store.date_to_idx[date], store.time_to_idx[time]])
     except KeyError:
         return None
+    return tables if tables >= 0 else None
 
 
 def get_available_slots(
-    availability: Dict[str, Any],
+    store: AvailabilityStore,
     restaurant_id: str,
     date: str,
     min_tables: int = 1
 ) -> List[Dict[str, Any]]:
     """Get all available time slots for a restaurant on a specific date"""
     try:
-        date_slots = availability[restaurant_id][date]
-        slots = [
-            {'time': time, 'available_tables': tables}
-            for time, tables in date_slots.items()
-            if tables >= min_tables
-        ]
-        return sorted(slots, key=lambda x: x['time'])
+        date_tables = store.tables[store.rid_to_idx[restaurant_id], store.date_to_idx[date]]
     except KeyError:
         return []
+    
+    # Store times are already sorted, so no per-call sort is needed
+    return [
+        {'time': store.times[i], 'available_tables': int(date_tables[i])}
+        for i in np.flatnonzero(date_tables >= max(min_tables, 0)).tolist()
+    ]
 
 
 def get_available_dates(
-    availability: Dict[str, Any],
+    store: AvailabilityStore,
     restaurant_id: str,
     min_tables: int = 1
 ) -> List[str]:
     """Get available dates for a restaurant"""
     try:
-        restaurant_availability = availability[restaurant_id]
-        dates = [
-            date for date, slots in restaurant_availability.items()
-            if any(tables >= min_tables for tables in slots.values())
-        ]
-        return sorted(dates)
+        restaurant_tables = store.tables[store.rid_to_idx[restaurant_id]]
     except KeyError:
         return []
+    
+    available = (restaurant_tables >= max(min_tables, 0)).any(axis=1)
+    return [store.dates[i] for i in np.flatnonzero(available).tolist()]
 
 
 def find_alternative_slots(
-    availability: Dict[str, Any],
+    store: AvailabilityStore,
     restaurant_id: str,
     date: str,
     preferred_time: str,
@@ -233,43 +411,77 @@ def find_alternative_slots(
     max_alternatives: int = 3
 ) -> List[Dict[str, Any]]:
     """Find alternative time slots if preferred time is not available"""
-    all_slots = get_available_slots(availability, restaurant_id, date, min_tables)
-    
-    # Remove preferred time
-    alternatives = [slot for slot in all_slots if slot['time'] != preferred_time]
+    try:
+        date_tables = store.tables[store.rid_to_idx[restaurant_id], store.date_to_idx[date]].tolist()
+    except KeyError:
+        return []
     
-    # Sort by proximity to preferred time
+    # The closest slots sit either side of the preferred time, so walk outwards from
+    # its insertion point, taking the nearer side first (the earlier slot on ties)
+    minutes = store.time_minutes
     preferred_minutes = time_to_minutes(preferred_time)
-    alternatives.sort(key=lambda slot: abs(time_to_minutes(slot['time']) - preferred_minutes))
+    right = bisect_left(minutes, preferred_minutes)
+    left = right - 1
+    alternatives = []
+    
+    while len(alternatives) < max_alternatives and (left >= 0 or right < len(minutes)):
+        if right >= len(minutes) or (left >= 0 and preferred_minutes - minutes[left] <= minutes[right] - preferred_minutes):
+            i = left
+            left -= 1
+        else:
+            i = right
+            right += 1
+        
+        # Skip the preferred time itself and slots without enough tables
+        if date_tables[i] >= max(min_tables, 0) and store.times[i] != preferred_time:
+            alternatives.append({'time': store.times[i], 'available_tables': date_tables[i]})
     
-    return alternatives[:max_alternatives]
+    return alternatives
 
 
 def check_multiple_restaurants(
-    availability: Dict[str, Any],
+    store: AvailabilityStore,
     restaurant_ids: List[str],
     date: str,
     time: str,
     min_tables: int = 1
 ) -> List[Dict[str, Any]]:
     """Check availability across multiple restaurants"""
-    results = []
-    for restaurant_id in restaurant_ids:
-        tables = check_availability(availability, restaurant_id, date, time) or 0
-        results.append({
-            'restaurant_id': restaurant_id,
-            'available': tables >= min_tables,
-            'tables': tables
-        })
-    return results
+    date_idx = store.date_to_idx.get(date)
+    time_idx = store.time_to_idx.get(time)
+    
+    if date_idx is None or time_idx is None:
+        tables = np.zeros(len(restaurant_ids), dtype=np.int8)
+    else:
+        # Gather every requested cell at once; unknown restaurants and unoffered slots count as 0 tables
+        rows = np.fromiter(
+            (store.rid_to_idx.get(restaurant_id, -1) for restaurant_id in restaurant_ids),
+            dtype=np.int32,
+            count=len(restaurant_ids)
+        )
+        tables = np.where(rows >= 0, np.maximum(store.tables[rows, date_idx, time_idx], 0), 0)
+    
+    return [
+        {'restaurant_id': restaurant_id, 'available': available, 'tables': count}
+        for restaurant_id, available, count in zip(
+            restaurant_ids, (tables >= min_tables).tolist(), tables.tolist()
+        )
+    ]
 
 
 # ============================================================================
 # DATE & TIME HELPERS
 # ============================================================================
 
+WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# (expires_at, YYYY-MM-DD) for _cached_today
+_today_cache: Tuple[float, str] = (0.0, '')
+
+
+@lru_cache(maxsize=1024)
 def time_to_minutes(time: str) -> int:
-    """Convert time string (HH:MM) to minutes since midnight"""
+    """Convert time string (HH:MM) to minutes since midnight, memoized per distinct time"""
     hours, minutes = map(int, time.split(':'))
     return hours * 60 + minutes
 
@@ -290,22 +502,38 @@ def get_days_from_now(days: int) -> str:
     return format_date(date)
 
 
+def _is_iso_date(date_string: str) -> bool:
+    """Check a string has the YYYY-MM-DD shape (other ISO forms like 20300105 or 2030-W02-1 don't)"""
+    return len(date_string) == 10 and date_string[4] == date_string[7] == '-'
+
+
 def parse_date(date_string: str) -> datetime:
     """Parse date string (YYYY-MM-DD) to datetime object"""
+    if _is_iso_date(date_string):
+        return datetime.combine(calendar_date.fromisoformat(date_string), datetime.min.time())
+    # Unpadded forms such as 2030-1-5 are still accepted
     return datetime.strptime(date_string, '%Y-%m-%d')
 
 
+def _cached_today() -> str:
+    """Get today's date as YYYY-MM-DD, recomputed at most once a minute"""
+    global _today_cache
+    expires_at, today = _today_cache
+    now = monotonic()
+    if now >= expires_at:
+        today = get_today()
+        _today_cache = (now + 60, today)
+    return today
+
+
 def is_date_in_past(date_string: str) -> bool:
-    """Check if date is in the past"""
-    date = parse_date(date_string)
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    return date < today
+    """Check if date is in the past (YYYY-MM-DD strings order the same as the dates)"""
+    return date_string < _cached_today()
 
 
 def get_day_of_week(date_string: str) -> str:
     """Get day of week name"""
-    date = parse_date(date_string)
-    return date.strftime('%A')
+    return WEEKDAY_NAMES[parse_date(date_string).weekday()]
 
 
 def is_weekend(date_string: str) -> bool:
@@ -318,10 +546,24 @@ def is_weekend(date_string: str) -> bool:
 # BOOKING HELPERS
 # ============================================================================
 
+# 32 symbols, so each character is exactly 5 random bits with no modulo bias
+BOOKING_ID_ALPHABET = string.ascii_uppercase + '234567'
+
+# (epoch second, YYYYMMDDHHMMSS) for generate_booking_id
+_booking_timestamp_cache: Tuple[int, str] = (-1, '')
+
+
 def generate_booking_id() -> str:
     """Generate a unique booking ID"""
-    timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-    random_str = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
+    global _booking_timestamp_cache
+    second = int(epoch_time())
+    cached_second, timestamp = _booking_timestamp_cache
+    if second != cached_second:
+        timestamp = datetime.fromtimestamp(second).strftime('%Y%m%d%H%M%S')
+        _booking_timestamp_cache = (second, timestamp)
+    
+    bits = random.getrandbits(20)
+    random_str = ''.join(BOOKING_ID_ALPHABET[(bits >> shift) & 31] for shift in (0, 5, 10, 15))
     return f"BK{timestamp}{random_str}"
 
 
@@ -355,8 +597,14 @@ def validate_booking(date: str, time: str, party_size: int) -> Tuple[bool, List[
     """Validate booking details"""
     errors = []
     
-    # Check if date is in the past
-    if is_date_in_past(date):
+    # Check date format first: the past-date check compares YYYY-MM-DD strings directly
+    try:
+        valid_date = _is_iso_date(date) and bool(parse_date(date))
+    except (TypeError, ValueError):
+        valid_date = False
+    if not valid_date:
+        errors.append('Invalid date format. Use YYYY-MM-DD')
+    elif is_date_in_past(date):
         errors.append('Cannot book for a past date')
     
     # Check party size
@@ -381,17 +629,31 @@ def update_availability_after_booking(
     restaurant_id: str,
     date: str,
     time: str,
-    tables_booked: int = 1
+    tables_booked: int = 1,
+    store: Optional[AvailabilityStore] = None
 ) -> Dict[str, Any]:
-    """Update availability after booking"""
-    import copy
-    updated = copy.deepcopy(availability)
-    
+    """Update availability after booking; returns a new dict (sharing untouched branches) and leaves
+    `availability` unmodified. If `store` is given, its matching slot is updated IN PLACE (skipped if the store lacks it)"""
     try:
-        current = updated[restaurant_id][date][time]
-        updated[restaurant_id][date][time] = max(0, current - tables_booked)
+        current = availability[restaurant_id][date][time]
     except KeyError:
-        pass
+        # Still hand back a new dict so callers can mutate the result without touching their input
+        return {**availability}
+    
+    # Only copy the dicts on the touched restaurant -> date path; everything else is shared
+    restaurant_availability = availability[restaurant_id]
+    updated = {
+        **availability,
+        restaurant_id: {**restaurant_availability, date: {**restaurant_availability[date]}}
+    }
+    updated[restaurant_id][date][time] = max(0, current - tables_booked)
+    
+    if store is not None:
+        restaurant_idx = store.rid_to_idx.get(restaurant_id)
+        date_idx = store.date_to_idx.get(date)
+        time_idx = store.time_to_idx.get(time)
+        if restaurant_idx is not None and date_idx is not None and time_idx is not None:
+            store.tables[restaurant_idx, date_idx, time_idx] = updated[restaurant_id][date][time]
     
     return updated
 
@@ -401,7 +663,7 @@ def update_availability_after_booking(
 # ============================================================================
 
 def get_recommendations(
-    restaurants: List[Dict[str, Any]],
+    index: RestaurantIndex,
     cuisine: Optional[str] = None,
     dietary_options: Optional[List[str]] = None,
     price_range: Optional[str] = None,
@@ -409,50 +671,54 @@ def get_recommendations(
     limit: int = 5
 ) -> List[Dict[str, Any]]:
     """Get restaurant recommendations based on preferences"""
-    scored = []
+    # Rating bonus
+    score = index.ratings * 2
     
-    for restaurant in restaurants:
-        score = 0
-        
-        # Exact cuisine match
-        if cuisine and restaurant['cuisine'].lower() == cuisine.lower():
-            score += 10
-        
-        # Dietary options match
-        if dietary_options:
-            match_count = sum(
-                1 for option in dietary_options
-                if any(opt.lower() == option.lower() for opt in restaurant['dietary_options'])
-            )
-            score += match_count * 5
-        
-        # Price range match
-        if price_range and restaurant['price_range'] == price_range:
-            score += 5
-        
-        # Rating bonus
-        score += restaurant['rating'] * 2
-        
-        # Min rating filter
-        if min_rating and restaurant['rating'] < min_rating:
-            score = -1  # Exclude
-        
-        if score > 0:
-            scored.append({'restaurant': restaurant, 'score': score})
+    # Exact cuisine match
+    if cuisine:
+        score[list(index.by_cuisine.get(cuisine.lower(), ()))] += 10
     
-    scored.sort(key=lambda x: x['score'], reverse=True)
-    return [item['restaurant'] for item in scored[:limit]]
+    # Dietary options match
+    if dietary_options:
+        columns = [
+            index.dietary_tags[option.lower()] for option in dietary_options
+            if option.lower() in index.dietary_tags
+        ]
+        score += 5 * index.dietary_matrix[:, columns].sum(axis=1)
+    
+    # Price range match
+    if price_range:
+        score[list(index.by_price.get(price_range, ()))] += 5
+    
+    # Min rating filter
+    if min_rating:
+        score[index.ratings < min_rating] = -1  # Exclude
+    
+    candidates = np.flatnonzero(score > 0)
+    
+    # Partition out the top `limit` scores in O(N), widening to every tie at the
+    # cutoff so the stable sort below keeps catalog order among equal scores
+    if 0 < limit < len(candidates):
+        top = np.argpartition(-score[candidates], limit - 1)[:limit]
+        cutoff = score[candidates[top]].min()
+        candidates = candidates[score[candidates] >= cutoff]
+    
+    ranked = candidates[np.argsort(-score[candidates], kind='stable')]
+    return [index.restaurants[position] for position in ranked[:limit].tolist()]
 
 
 def find_similar_restaurants(
-    restaurants: List[Dict[str, Any]],
+    index: RestaurantIndex,
     target_restaurant: Dict[str, Any],
     limit: int = 3
 ) -> List[Dict[str, Any]]:
     """Find similar restaurants"""
     scored = []
+    target_mask = dietary_mask(
+        index, frozenset(option.lower() for option in target_restaurant['dietary_options'])
+    )
     
-    for restaurant in restaurants:
+    for position, restaurant in enumerate(index.restaurants):
         if restaurant['id'] == target_restaurant['id']:
             continue
         
@@ -475,7 +741,7 @@ def find_similar_restaurants(
             score += 2
         
         # Shared dietary options
-        shared = len(set(restaurant['dietary_options']) & set(target_restaurant['dietary_options']))
+        shared = (index.dietary_masks[position] & target_mask).bit_count()
         score += shared
         
         scored.append({'restaurant': restaurant, 'score': score})
@@ -537,71 +803,49 @@ def format_price_range(price_symbol: str) -> str:
 # STATISTICS HELPERS
 # ============================================================================
 
-def get_restaurant_stats(restaurants: List[Dict[str, Any]]) -> Dict[str, Any]:
+def get_restaurant_stats(index: RestaurantIndex) -> Dict[str, Any]:
     """Get restaurant statistics"""
-    stats = {
-        'total': len(restaurants),
-        'by_cuisine': {},
-        'by_location': {},
-        'by_price_range': {},
-        'average_rating': 0
+    return {
+        'total': len(index.restaurants),
+        'by_cuisine': dict(zip(index.cuisine_names, np.bincount(index.cuisine_codes).tolist())),
+        'by_location': dict(zip(index.location_names, np.bincount(index.location_codes).tolist())),
+        'by_price_range': dict(zip(index.price_names, np.bincount(index.price_codes).tolist())),
+        'average_rating': float(index.ratings.mean()) if index.restaurants else 0
     }
-    
-    total_rating = 0
-    
-    for restaurant in restaurants:
-        # Count by cuisine
-        cuisine = restaurant['cuisine']
-        stats['by_cuisine'][cuisine] = stats['by_cuisine'].get(cuisine, 0) + 1
-        
-        # Count by location
-        location = restaurant['location']
-        stats['by_location'][location] = stats['by_location'].get(location, 0) + 1
-        
-        # Count by price range
-        price = restaurant['price_range']
-        stats['by_price_range'][price] = stats['by_price_range'].get(price, 0) + 1
-        
-        # Sum ratings
-        total_rating += restaurant['rating']
-    
-    stats['average_rating'] = total_rating / len(restaurants) if restaurants else 0
-    
-    return stats
 
 
-def get_availability_stats(availability: Dict[str, Any], restaurant_id: str) -> Dict[str, Any]:
-    """Get availability statistics for a restaurant"""
-    try:
-        restaurant_availability = availability[restaurant_id]
-    except KeyError:
-        return {
-            'total_slots': 0,
-            'available_slots': 0,
-            'fully_booked_slots': 0,
-            'availability_rate': 0
-        }
-    
-    total_slots = 0
-    available_slots = 0
-    fully_booked_slots = 0
-    
-    for date_slots in restaurant_availability.values():
-        for tables in date_slots.values():
-            total_slots += 1
-            if tables > 0:
-                available_slots += 1
-            else:
-                fully_booked_slots += 1
-    
+def _availability_stats(total_slots: int, available_slots: int) -> Dict[str, Any]:
+    """Build the availability statistics dict from slot counts"""
     return {
         'total_slots': total_slots,
         'available_slots': available_slots,
-        'fully_booked_slots': fully_booked_slots,
+        'fully_booked_slots': total_slots - available_slots,
         'availability_rate': (available_slots / total_slots * 100) if total_slots > 0 else 0
     }
 
 
+def get_availability_stats(store: AvailabilityStore, restaurant_id: str) -> Dict[str, Any]:
+    """Get availability statistics for a restaurant"""
+    if restaurant_id not in store.rid_to_idx:
+        return _availability_stats(0, 0)
+    
+    restaurant_tables = store.tables[store.rid_to_idx[restaurant_id]]
+    return _availability_stats(
+        int((restaurant_tables >= 0).sum()),
+        int((restaurant_tables > 0).sum())
+    )
+
+
+def get_all_availability_stats(store: AvailabilityStore) -> Dict[str, Dict[str, Any]]:
+    """Get availability statistics for every restaurant in one pass over the store"""
+    total_slots = (store.tables >= 0).sum(axis=(1, 2)).tolist()
+    available_slots = (store.tables > 0).sum(axis=(1, 2)).tolist()
+    return {
+        restaurant_id: _availability_stats(total, available)
+        for restaurant_id, total, available in zip(store.restaurant_ids, total_slots, available_slots)
+    }
+
+
 # ============================================================================
 # EXAMPLE USAGE
 # ============================================================================
@@ -613,11 +857,13 @@ if __name__ == "__main__":
     print("1. Loading data...")
     restaurants = load_restaurants()
     availability = load_availability()
+    restaurant_index = build_restaurant_index(restaurants)
+    availability_store = build_availability_store(availability)
     print(f"   Loaded {len(restaurants)} restaurants\n")
     
     # Search restaurants
     print("2. Searching for Italian restaurants...")
-    italian = search_restaurants(restaurants, cuisine="Italian")
+    italian = search_restaurants(restaurant_index, cuisine="Italian")
     print(f"   Found {len(italian)} Italian restaurants\n")
     
     # Check availability
@@ -625,13 +871,13 @@ if __name__ == "__main__":
         print("3. Checking availability...")
         restaurant_id = restaurants[0]['id']
         today = get_today()
-        tables = check_availability(availability, restaurant_id, today, "19:00")
+        tables = check_availability(availability_store, restaurant_id, today, "19:00")
         print(f"   Restaurant {restaurant_id} has {tables} tables at 19:00 today\n")
     
     # Get recommendations
     print("4. Getting recommendations...")
     recommendations = get_recommendations(
-        restaurants,
+        restaurant_index,
         cuisine="Italian",
         dietary_options=["vegetarian"],
         min_rating=4.0,
@@ -655,7 +901,7 @@ if __name__ == "__main__":
     
     # Get statistics
     print("6. Restaurant statistics...")
-    stats = get_restaurant_stats(restaurants)
+    stats = get_restaurant_stats(restaurant_index)
     print(f"   Total restaurants: {stats['total']}")
     print(f"   Average rating: {stats['average_rating']:.2f}")
     print(f"   Cuisines: {', '.join(stats['by_cuisine'].keys())}")
@@ -1,144 +1,380 @@
-import json
-import random
-from typing import List, Dict, Any, Optional
+# pip install numpy orjson
+import argparse
+import io
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, TextIO, Tuple
+import numpy as np
+import orjson
 
 
-def generate_restaurants(count: int, save_to_file: bool = False) -> str:
+@dataclass(frozen=True)
+class Template:
+    """Base data each generated restaurant is cycled from"""
+    name_prefix: str
+    name_suffix: Tuple[str, ...]
+    cuisine: str
+    location: Tuple[str, ...]
+    price_range: str
+    dietary_base: Tuple[str, ...]
+    features_base: Tuple[str, ...]
+    dishes_base: Tuple[str, ...]
+
+
+RESTAURANT_TEMPLATES = [
+    Template(
+        name_prefix="Bella",
+        name_suffix=("Italia", "Napoli", "Roma", "Toscana", "Venezia"),
+        cuisine="Italian",
+        location=("Downtown", "Midtown", "Uptown", "Old Town", "West End"),
+        price_range="$$$",
+        dietary_base=("vegetarian", "gluten-free", "vegan"),
+        features_base=("romantic ambiance", "wine bar", "pasta made fresh daily", "outdoor patio"),
+        dishes_base=("Truffle Carbonara", "Osso Buco", "Margherita Pizza", "Tiramisu")
+    ),
+    Template(
+        name_prefix="Sakura",
+        name_suffix=("Sushi", "Japanese Bistro", "Izakaya", "Ramen House", "Sushi Bar"),
+        cuisine="Japanese",
+        location=("Downtown", "Midtown", "Uptown", "East Side", "Arts District"),
+        price_range="$$",
+        dietary_base=("vegetarian", "gluten-free", "vegan"),
+        features_base=("sushi bar seating", "sake selection", "omakase available", "authentic Japanese"),
+        dishes_base=("Omakase", "Spicy Tuna Roll", "Ramen", "Tempura")
+    ),
+    Template(
+        name_prefix="The Steakhouse",
+        name_suffix=("Prime", "Grill", "Chophouse", "& Co", "Club"),
+        cuisine="American Steakhouse",
+        location=("Financial District", "Downtown", "Uptown", "Business District", "Harbor"),
+        price_range="$$$$",
+        dietary_base=("gluten-free",),
+        features_base=("dry-aged beef", "wine cellar", "private dining rooms", "valet parking"),
+        dishes_base=("Ribeye Steak", "Filet Mignon", "Lobster Tail", "NY Cheesecake")
+    ),
+    Template(
+        name_prefix="Spice",
+        name_suffix=("of India", "Kitchen", "Palace", "Garden", "Tandoor"),
+        cuisine="Indian",
+        location=("Midtown", "University District", "Downtown", "West End", "Little India"),
+        price_range="$$",
+        dietary_base=("vegetarian", "vegan", "gluten-free"),
+        features_base=("tandoor oven", "lunch buffet", "authentic spices", "family-owned"),
+        dishes_base=("Chicken Tikka Masala", "Palak Paneer", "Biryani", "Naan Bread")
+    ),
+    Template(
+        name_prefix="Le",
+        name_suffix=("Bistro", "Café", "Jardin", "Petit", "Bouchon"),
+        cuisine="French",
+        location=("Downtown", "Arts District", "Old Town", "Riverside", "Historic District"),
+        price_range="$$$",
+        dietary_base=("vegetarian", "gluten-free"),
+        features_base=("french wine list", "outdoor seating", "romantic setting", "chef-owned"),
+        dishes_base=("Coq au Vin", "Bouillabaisse", "Crème Brûlée", "Escargot")
+    ),
+    Template(
+        name_prefix="Taco",
+        name_suffix=("Loco", "Fiesta", "Cantina", "Casa", "Express"),
+        cuisine="Mexican",
+        location=("Downtown", "Beach Area", "Midtown", "South Side", "Market District"),
+        price_range="$",
+        dietary_base=("vegetarian", "vegan", "gluten-free"),
+        features_base=("margarita bar", "taco tuesday", "fresh ingredients", "casual dining"),
+        dishes_base=("Street Tacos", "Carnitas", "Guacamole", "Churros")
+    ),
+    Template(
+        name_prefix="Dragon",
+        name_suffix=("Palace", "Garden", "Wok", "House", "Kitchen"),
+        cuisine="Chinese",
+        location=("Chinatown", "Downtown", "Midtown", "East Side", "University Area"),
+        price_range="$$",
+        dietary_base=("vegetarian", "vegan", "gluten-free"),
+        features_base=("dim sum", "family-style dining", "authentic recipes", "lunch specials"),
+        dishes_base=("Peking Duck", "Kung Pao Chicken", "Dumplings", "Fried Rice")
+    ),
+    Template(
+        name_prefix="Mediterranean",
+        name_suffix=("Grill", "Kitchen", "Taverna", "Cafe", "Bistro"),
+        cuisine="Mediterranean",
+        location=("Downtown", "Waterfront", "Old Town", "Arts District", "Beach Area"),
+        price_range="$$",
+        dietary_base=("vegetarian", "vegan", "gluten-free"),
+        features_base=("healthy options", "fresh seafood", "outdoor patio", "mezze platters"),
+        dishes_base=("Lamb Kebab", "Falafel", "Hummus Platter", "Baklava")
+    )
+]
+
+# Price symbol -> average price per person
+PRICE_RANGES = {
+    '$': '$10-20',
+    '$$': '$20-40',
+    '$$$': '$40-70',
+    '$$$$': '$70-150'
+}
+
+# One restaurant laid out as orjson.dumps(restaurants, option=orjson.OPT_INDENT_2) would write it
+RESTAURANT_JSON_TEMPLATE = """  {
+    "id": "r%d",
+    "name": %s,
+    "cuisine": %s,
+    "location": %s,
+    "price_range": %s,
+    "rating": %r,
+    "dietary_options": %s,
+    "hours": %s,
+    "phone": "(555) %d-%d",
+    "address": "%d %s Street",
+    "features": %s,
+    "popular_dishes": %s,
+    "average_price_per_person": %s,
+    "reservations_required": %s,
+    "outdoor_seating": %s,
+    "private_dining": %s,
+    "takeout_available": true,
+    "delivery_available": %s
+  }"""
+
+
+def to_json_field(value: Any) -> str:
+    """Serialize a value as it appears nested one level inside a restaurant record"""
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode().replace('\n', '\n    ')
+
+
+JSON_BOOLEANS = ('false', 'true')
+DINNER_HOURS = {"dinner": "5:00pm-10:00pm"}
+HOURS_JSON = to_json_field(DINNER_HOURS)
+HOURS_WITH_LUNCH_JSON = to_json_field({**DINNER_HOURS, "lunch": "11:30am-2:30pm"})
+
+
+def draw_restaurant_columns(count: int, rng: np.random.Generator) -> Dict[str, List[Any]]:
     """
-    Generates restaurant data in JSON format
+    Draws all random restaurant fields as columns of plain Python values
     
     Args:
-        count: Number of restaurant objects to generate
-        save_to_file: Whether to save the generated data to restaurants.json
+        count: Number of restaurants to draw fields for
+        rng: NumPy random generator to draw from
         
     Returns:
-        JSON string of generated restaurants
+        Dict mapping field name to a list of `count` values
     """
-    restaurants: List[Dict[str, Any]] = []
+    # One call for every uniform draw: rating, outdoor seating, delivery, lunch hours
+    uniform = rng.random((4, count))
+    
+    # One call for every integer draw: phone middle/end digits, street number
+    phone_mid, phone_end, address_numbers = rng.integers(
+        (100, 1000, 100), (1000, 10000, 1000), size=(count, 3)
+    ).T.tolist()
     
-    restaurant_templates = [
-        {
-            "name_prefix": "Bella",
-            "name_suffix": ["Italia", "Napoli", "Roma", "Toscana", "Venezia"],
-            "cuisine": "Italian",
-            "location": ["Downtown", "Midtown", "Uptown", "Old Town", "West End"],
-            "price_range": "$$$",
-            "dietary_base": ["vegetarian", "gluten-free", "vegan"],
-            "features_base": ["romantic ambiance", "wine bar", "pasta made fresh daily", "outdoor patio"],
-            "dishes_base": ["Truffle Carbonara", "Osso Buco", "Margherita Pizza", "Tiramisu"]
-        },
-        {
-            "name_prefix": "Sakura",
-            "name_suffix": ["Sushi", "Japanese Bistro", "Izakaya", "Ramen House", "Sushi Bar"],
-            "cuisine": "Japanese",
-            "location": ["Downtown", "Midtown", "Uptown", "East Side", "Arts District"],
-            "price_range": "$$",
-            "dietary_base": ["vegetarian", "gluten-free", "vegan"],
-            "features_base": ["sushi bar seating", "sake selection", "omakase available", "authentic Japanese"],
-            "dishes_base": ["Omakase", "Spicy Tuna Roll", "Ramen", "Tempura"]
-        },
-        {
-            "name_prefix": "The Steakhouse",
-            "name_suffix": ["Prime", "Grill", "Chophouse", "& Co", "Club"],
-            "cuisine": "American Steakhouse",
-            "location": ["Financial District", "Downtown", "Uptown", "Business District", "Harbor"],
-            "price_range": "$$$$",
-            "dietary_base": ["gluten-free"],
-            "features_base": ["dry-aged beef", "wine cellar", "private dining rooms", "valet parking"],
-            "dishes_base": ["Ribeye Steak", "Filet Mignon", "Lobster Tail", "NY Cheesecake"]
-        },
-        {
-            "name_prefix": "Spice",
-            "name_suffix": ["of India", "Kitchen", "Palace", "Garden", "Tandoor"],
-            "cuisine": "Indian",
-            "location": ["Midtown", "University District", "Downtown", "West End", "Little India"],
-            "price_range": "$$",
-            "dietary_base": ["vegetarian", "vegan", "gluten-free"],
-            "features_base": ["tandoor oven", "lunch buffet", "authentic spices", "family-owned"],
-            "dishes_base": ["Chicken Tikka Masala", "Palak Paneer", "Biryani", "Naan Bread"]
-        },
-        {
-            "name_prefix": "Le",
-            "name_suffix": ["Bistro", "Café", "Jardin", "Petit", "Bouchon"],
-            "cuisine": "French",
-            "location": ["Downtown", "Arts District", "Old Town", "Riverside", "Historic District"],
-            "price_range": "$$$",
-            "dietary_base": ["vegetarian", "gluten-free"],
-            "features_base": ["french wine list", "outdoor seating", "romantic setting", "chef-owned"],
-            "dishes_base": ["Coq au Vin", "Bouillabaisse", "Crème Brûlée", "Escargot"]
-        },
-        {
-            "name_prefix": "Taco",
-            "name_suffix": ["Loco", "Fiesta", "Cantina", "Casa", "Express"],
-            "cuisine": "Mexican",
-            "location": ["Downtown", "Beach Area", "Midtown", "South Side", "Market District"],
-            "price_range": "$",
-            "dietary_base": ["vegetarian", "vegan", "gluten-free"],
-            "features_base": ["margarita bar", "taco tuesday", "fresh ingredients", "casual dining"],
-            "dishes_base": ["Street Tacos", "Carnitas", "Guacamole", "Churros"]
-        },
-        {
-            "name_prefix": "Dragon",
-            "name_suffix": ["Palace", "Garden", "Wok", "House", "Kitchen"],
-            "cuisine": "Chinese",
-            "location": ["Chinatown", "Downtown", "Midtown", "East Side", "University Area"],
-            "price_range": "$$",
-            "dietary_base": ["vegetarian", "vegan", "gluten-free"],
-            "features_base": ["dim sum", "family-style dining", "authentic recipes", "lunch specials"],
-            "dishes_base": ["Peking Duck", "Kung Pao Chicken", "Dumplings", "Fried Rice"]
-        },
-        {
-            "name_prefix": "Mediterranean",
-            "name_suffix": ["Grill", "Kitchen", "Taverna", "Cafe", "Bistro"],
-            "cuisine": "Mediterranean",
-            "location": ["Downtown", "Waterfront", "Old Town", "Arts District", "Beach Area"],
-            "price_range": "$$",
-            "dietary_base": ["vegetarian", "vegan", "gluten-free"],
-            "features_base": ["healthy options", "fresh seafood", "outdoor patio", "mezze platters"],
-            "dishes_base": ["Lamb Kebab", "Falafel", "Hummus Platter", "Baklava"]
-        }
+    return {
+        'ratings': np.round(4.0 + uniform[0], 1).tolist(),
+        'outdoor_seating': (uniform[1] > 0.5).tolist(),
+        'delivery_available': (uniform[2] > 0.3).tolist(),
+        'has_lunch': (uniform[3] > 0.3).tolist(),
+        'phone_mid': phone_mid,
+        'phone_end': phone_end,
+        'address_numbers': address_numbers
+    }
+
+
+@lru_cache(maxsize=None)
+def get_template_cache() -> List[Tuple[Any, ...]]:
+    """
+    Pre-serializes everything that only depends on the template, once per process,
+    so each record is a single string fill instead of a dict walked by a serializer
+    """
+    return [
+        (
+            [to_json_field(f"{template.name_prefix} {suffix}") for suffix in template.name_suffix],
+            to_json_field(template.cuisine),
+            [(to_json_field(location), to_json_field(location)[1:-1]) for location in template.location],
+            to_json_field(template.price_range),
+            to_json_field(get_price_range(template.price_range)),
+            # Upscale: reservations required, private dining
+            to_json_field(len(template.price_range) >= 3),
+            to_json_field(template.dietary_base),
+            to_json_field(template.features_base),
+            to_json_field(template.dishes_base)
+        )
+        for template in RESTAURANT_TEMPLATES
     ]
+
+
+def render_restaurant_records(start: int, columns: Dict[str, List[Any]]) -> Iterator[str]:
+    """
+    Formats JSON records for a run of consecutive restaurants
     
-    for i in range(count):
-        template = restaurant_templates[i % len(restaurant_templates)]
-        suffix_index = (i // len(restaurant_templates)) % len(template["name_suffix"])
-        location_index = i % len(template["location"])
+    Args:
+        start: Zero-based position of the first restaurant in the run
+        columns: Random field columns for the run, from draw_restaurant_columns
         
-        restaurant = {
-            "id": f"r{i + 1}",
-            "name": f"{template['name_prefix']} {template['name_suffix'][suffix_index]}",
-            "cuisine": template["cuisine"],
-            "location": template["location"][location_index],
-            "price_range": template["price_range"],
-            "rating": round(4.0 + random.random() * 1.0, 1),
-            "dietary_options": template["dietary_base"],
-            "hours": {
-                "dinner": "5:00pm-10:00pm"
-            },
-            "phone": f"(555) {random.randint(100, 999)}-{random.randint(1000, 9999)}",
-            "address": f"{random.randint(100, 999)} {template['location'][location_index]} Street",
-            "features": template["features_base"],
-            "popular_dishes": template["dishes_base"],
-            "average_price_per_person": get_price_range(template["price_range"]),
-            "reservations_required": len(template["price_range"]) >= 3,
-            "outdoor_seating": random.random() > 0.5,
-            "private_dining": len(template["price_range"]) >= 3,
-            "takeout_available": True,
-            "delivery_available": random.random() > 0.3
-        }
+    Returns:
+        Iterator of indented JSON objects, one per restaurant
+    """
+    template_cache = get_template_cache()
+    count = len(columns['ratings'])
+    
+    # Template, name suffix and location index for every restaurant, computed as
+    # whole-array modulo/divide instead of per-iteration len() calls
+    positions = np.arange(start, start + count)
+    template_indexes = positions % len(template_cache)
+    suffix_counts = np.array([len(cached[0]) for cached in template_cache])
+    location_counts = np.array([len(cached[2]) for cached in template_cache])
+    suffix_indexes = (positions // len(template_cache)) % suffix_counts[template_indexes]
+    location_indexes = positions % location_counts[template_indexes]
+    
+    # Convert the flag columns to their JSON text column by column
+    hours = [
+        HOURS_WITH_LUNCH_JSON if has_lunch else HOURS_JSON  # Lunch hours for 70% of restaurants
+        for has_lunch in columns['has_lunch']
+    ]
+    outdoor_seating = [JSON_BOOLEANS[flag] for flag in columns['outdoor_seating']]
+    delivery_available = [JSON_BOOLEANS[flag] for flag in columns['delivery_available']]
+    
+    # Fill each record by walking all columns in lockstep
+    for restaurant_number, (
+        template_index, suffix_index, location_index, rating, hours_json,
+        phone_mid, phone_end, address_number, outdoor_json, delivery_json
+    ) in enumerate(zip(
+        template_indexes.tolist(), suffix_indexes.tolist(), location_indexes.tolist(),
+        columns['ratings'], hours, columns['phone_mid'], columns['phone_end'],
+        columns['address_numbers'], outdoor_seating, delivery_available
+    ), start + 1):
+        (names, cuisine, locations, price_range, average_price,
+         upscale, dietary_options, features, popular_dishes) = template_cache[template_index]
+        location, address_location = locations[location_index]
         
-        # Add lunch hours for 70% of restaurants
-        if random.random() > 0.3:
-            restaurant["hours"]["lunch"] = "11:30am-2:30pm"
+        yield RESTAURANT_JSON_TEMPLATE % (
+            restaurant_number,
+            names[suffix_index],
+            cuisine,
+            location,
+            price_range,
+            rating,
+            dietary_options,
+            hours_json,
+            phone_mid, phone_end,
+            address_number, address_location,
+            features,
+            popular_dishes,
+            average_price,
+            upscale,
+            outdoor_json,
+            upscale,
+            delivery_json
+        )
+
+
+def render_restaurant_chunk(start: int, columns: Dict[str, List[Any]]) -> str:
+    """Formats a run of restaurants as one comma-joined JSON fragment (process pool worker)"""
+    return ",\n".join(render_restaurant_records(start, columns))
+
+
+def iter_restaurant_fragments(columns: Dict[str, List[Any]], workers: Optional[int]) -> Iterator[str]:
+    """Yields comma-joinable JSON fragments in order, rendering chunks in parallel if workers > 1"""
+    count = len(columns['ratings'])
+    if not workers or workers <= 1 or count == 0:
+        yield from render_restaurant_records(0, columns)
+        return
+    
+    # Restaurants are independent, so each worker formats one contiguous slice
+    chunk_size = -(-count // workers)
+    starts = list(range(0, count, chunk_size))
+    chunks = [
+        {name: values[start:start + chunk_size] for name, values in columns.items()}
+        for start in starts
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(render_restaurant_chunk, starts, chunks)
+
+
+def write_restaurants_json(columns: Dict[str, List[Any]], out: TextIO, workers: Optional[int] = None) -> None:
+    """
+    Writes the restaurants as a JSON array straight to a text stream, fragment by fragment
+    
+    Args:
+        columns: Random field columns, from draw_restaurant_columns
+        out: Text stream to write to (an open file or io.StringIO)
+        workers: Number of processes to format records with (default: format in this process)
+    """
+    write = out.write
+    write('[')
+    for i, fragment in enumerate(iter_restaurant_fragments(columns, workers)):
+        write(',\n' if i else '\n')
+        write(fragment)
+    write('\n]' if columns['ratings'] else ']')
+
+
+# JSON for the most recent seeded runs, keyed on (count, seed) only: workers never
+# changes the output, so it must not split the cache (the strings can be very large)
+GENERATED_JSON_CACHE_SIZE = 8
+_generated_json: "OrderedDict[Tuple[int, int], str]" = OrderedDict()
+
+
+def _gen_json(count: int, seed: int, workers: Optional[int]) -> str:
+    """Builds the JSON string for a seeded run, reusing it for a repeated (count, seed)"""
+    key = (count, seed)
+    json_string = _generated_json.get(key)
+    if json_string is not None:
+        _generated_json.move_to_end(key)
+        return json_string
+    
+    columns = draw_restaurant_columns(count, np.random.default_rng(seed))
+    buffer = io.StringIO()
+    write_restaurants_json(columns, buffer, workers)
+    json_string = _generated_json[key] = buffer.getvalue()
+    if len(_generated_json) > GENERATED_JSON_CACHE_SIZE:
+        _generated_json.popitem(last=False)
+    return json_string
+
+
+def generate_restaurants(
+    count: int,
+    save_to_file: bool = False,
+    return_string: bool = True,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None
+) -> Optional[str]:
+    """
+    Generates restaurant data in JSON format
+    
+    Args:
+        count: Number of restaurant objects to generate
+        save_to_file: Whether to save the generated data to restaurants.json
+        return_string: Whether to build and return the JSON string. When False
+            (with save_to_file=True) records are streamed to disk one at a time
+        workers: Number of processes to format records with (default: format in this process).
+            Only pays off on multi-core machines for very large counts (100k+)
+        seed: Seed for the random generator. Seeded calls are deterministic, so the
+            JSON for recent (count, seed) pairs is cached and reused
         
-        restaurants.append(restaurant)
+    Returns:
+        JSON string of generated restaurants, or None if return_string is False
+    """
+    count = max(count, 0)
     
-    json_string = json.dumps(restaurants, indent=2)
+    json_string = None
+    if return_string and seed is not None:
+        json_string = _gen_json(count, seed, workers)
+    else:
+        # Phase 1: draw every random field for all restaurants up front (structure of arrays)
+        columns = draw_restaurant_columns(count, np.random.default_rng(seed))
+        
+        # Phase 2: format the records straight into the output, with no per-record dicts
+        if return_string:
+            buffer = io.StringIO()
+            write_restaurants_json(columns, buffer, workers)
+            json_string = buffer.getvalue()
     
     if save_to_file:
         try:
             with open('restaurants.json', 'w', encoding='utf-8') as f:
-                f.write(json_string)
+                if json_string is not None:
+                    f.write(json_string)
+                else:
+                    # Stream fragment by fragment so the full document is never held in memory
+                    write_restaurants_json(columns, f, workers)
             print(f"Successfully saved {count} restaurants to restaurants.json")
         except Exception as e:
             print(f"Error saving to file: {e}")
@@ -148,18 +384,18 @@ def generate_restaurants(count: int, save_to_file: bool = False) -> str:
 
 def get_price_range(price_symbol: str) -> str:
     """Convert price symbols to price ranges"""
-    ranges = {
-        '$': '$10-20',
-        '$$': '$20-40',
-        '$$$': '$40-70',
-        '$$$$': '$70-150'
-    }
-    return ranges.get(price_symbol, '$20-40')
+    return PRICE_RANGES.get(price_symbol, '$20-40')
 
 
 # Example usage
 if __name__ == "__main__":
-    # Generate 5 restaurants and save to file
-    result = generate_restaurants(5, save_to_file=True)
+    parser = argparse.ArgumentParser(description="Generate sample restaurant data")
+    parser.add_argument("--count", type=int, default=5, help="Number of restaurants to generate (default: 5)")
+    parser.add_argument("--save", action="store_true", help="Save the generated data to restaurants.json")
+    parser.add_argument("--workers", type=int, default=None, help="Processes to format records with")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible output")
+    args = parser.parse_args()
+    
+    result = generate_restaurants(args.count, save_to_file=args.save, workers=args.workers, seed=args.seed)
     print("\nGenerated restaurants:")
     print(result)